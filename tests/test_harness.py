@@ -0,0 +1,92 @@
+"""
+file: test_harness.py
+description: This program tests that the harness separates engine mismatches
+from construction defects.
+language: python3
+author: Anurag Kallurwar, ak6491@rit.edu
+author: Neel Chaudhary, nc5834@rit.edu
+"""
+
+
+from trapezoidal_maps import harness
+from trapezoidal_maps.cli import main
+from trapezoidal_maps.construction import build_map
+from trapezoidal_maps.harness import LOCATE_ENGINES, run_harness
+
+
+CASES = 10
+
+
+def first_leaf_engine(map):
+    """
+    Wrong engine answering the first leaf of the map for every point
+    """
+    trapezoid = map.trapezoidal_nodes[0].value
+    return lambda point: trapezoid
+
+
+def unbounded_build_map(initial_trapezoid, segments: list):
+    """
+    Build the map and drop the right point of its first leaf, so that every
+    built map has a construction defect
+    """
+    map = build_map(initial_trapezoid, segments)
+    map.trapezoidal_nodes[0].value.right = None
+    return map
+
+
+def seeds_with(findings: list, text: str):
+    """
+    Seeds of the findings containing the text
+    """
+    return sorted({int(finding.split(":")[0].split()[1])
+                   for finding in findings if text in finding})
+
+
+def test_engines_agree():
+    mismatches, defects, stats = run_harness(cases=20, queries=200)
+    assert mismatches == []
+    assert stats["failed_seeds"] == []
+    for name in LOCATE_ENGINES:
+        assert name in stats["seconds"]
+
+
+def test_wrong_engine_is_reported_on_every_case():
+    engines = dict(LOCATE_ENGINES)
+    engines["first-leaf"] = first_leaf_engine
+    mismatches, defects, stats = run_harness(cases=CASES, queries=200,
+                                             engines=engines)
+    built = [seed for seed in range(CASES)
+             if seed not in seeds_with(defects, "build failed")]
+    assert all("first-leaf" in mismatch for mismatch in mismatches)
+    assert stats["failed_seeds"] == built
+
+
+def test_defects_are_not_mismatches(monkeypatch):
+    monkeypatch.setattr(harness, "build_map", unbounded_build_map)
+    mismatches, defects, stats = run_harness(cases=CASES, queries=200)
+    built = [seed for seed in range(CASES)
+             if seed not in seeds_with(defects, "build failed")]
+    assert mismatches == []
+    assert stats["failed_seeds"] == []
+    assert seeds_with(defects, "build left unbounded") == built
+    assert stats["defect_seeds"] == list(range(CASES))
+
+
+def test_exit_status_ignores_construction_defects(monkeypatch, capsys):
+    monkeypatch.setattr(harness, "build_map", unbounded_build_map)
+    assert main(["check", "--cases", str(CASES), "--queries", "100"]) == 0
+    out = capsys.readouterr().out
+    assert "Mismatches with dag: 0" in out
+    assert "Construction defects: 0" not in out
+
+
+def test_exit_status_reports_engine_mismatches(monkeypatch):
+    monkeypatch.setitem(LOCATE_ENGINES, "first-leaf", first_leaf_engine)
+    assert main(["check", "--cases", str(CASES), "--queries", "100"]) == 1
+
+
+def test_seed_reproduces_case():
+    first = run_harness(cases=1, queries=100, seed=4)
+    second = run_harness(cases=1, queries=100, seed=4)
+    assert first[0] == second[0] and first[1] == second[1]
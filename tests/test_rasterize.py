@@ -0,0 +1,84 @@
+"""
+file: test_rasterize.py
+description: This program tests that the scan converted label array agrees
+with point location for every pixel center, tiled or not.
+language: python3
+author: Anurag Kallurwar, ak6491@rit.edu
+author: Neel Chaudhary, nc5834@rit.edu
+"""
+
+
+import os
+import pytest
+from trapezoidal_maps.construction import build_map, read_input
+from trapezoidal_maps.structure import Point
+
+np = pytest.importorskip("numpy")
+from trapezoidal_maps.rasterize import NO_TRAPEZOID, map_bounds, \
+    pixel_centers, rasterize_map
+
+
+SAMPLE_FILE = os.path.join(os.path.dirname(__file__), "..", "ak6491.txt")
+WIDTH = 157
+HEIGHT = 131
+
+
+@pytest.fixture(scope="module")
+def sample_map():
+    number_of_segments, bounding_box, segments = read_input(SAMPLE_FILE)
+    return build_map(bounding_box, segments)
+
+
+def test_labels_match_point_location(sample_map):
+    trapezoids = [node.value for node in sample_map.trapezoidal_nodes]
+    labels = rasterize_map(trapezoids, WIDTH, HEIGHT)
+    min_x, min_y, max_x, max_y = map_bounds(trapezoids)
+    xs = pixel_centers(min_x, max_x, WIDTH)
+    ys = pixel_centers(min_y, max_y, HEIGHT)
+    for row, y in enumerate(ys):
+        for column, x in enumerate(xs):
+            point = Point(float(x), float(y))
+            found = [index for index, trapezoid in enumerate(trapezoids)
+                     if trapezoid.contains_point(point)]
+            assert found == [labels[row, column]]
+            assert sample_map.root.locate(point).value is \
+                   trapezoids[labels[row, column]]
+
+
+@pytest.mark.parametrize("tile_size", [1, 7, 64, 500])
+def test_tiles_match_untiled(sample_map, tile_size):
+    trapezoids = [node.value for node in sample_map.trapezoidal_nodes]
+    expected = rasterize_map(trapezoids, WIDTH, HEIGHT)
+    labels = rasterize_map(trapezoids, WIDTH, HEIGHT, tile_size=tile_size)
+    assert np.array_equal(labels, expected)
+
+
+def test_unbounded_leaf_is_skipped():
+    number_of_segments, bounding_box, segments = read_input(SAMPLE_FILE)
+    trapezoids = [node.value for node in
+                  build_map(bounding_box, segments).trapezoidal_nodes]
+    # Leaf left without a right point, as the construction sometimes does
+    unbounded = 5
+    trapezoids[unbounded].right = None
+    assert map_bounds(trapezoids) == (0.0, 0.0, 100.0, 100.0)
+    labels = rasterize_map(trapezoids, WIDTH, HEIGHT)
+    assert not (labels == unbounded).any()
+    assert (labels == NO_TRAPEZOID).any()
+    xs = pixel_centers(0.0, 100.0, WIDTH)
+    ys = pixel_centers(0.0, 100.0, HEIGHT)
+    bounded = [trapezoid for index, trapezoid in enumerate(trapezoids)
+               if index != unbounded]
+    for row, y in enumerate(ys):
+        for column, x in enumerate(xs):
+            point = Point(float(x), float(y))
+            found = [trapezoids.index(trapezoid) for trapezoid in bounded
+                     if trapezoid.contains_point(point)]
+            assert found == ([labels[row, column]]
+                             if labels[row, column] != NO_TRAPEZOID else [])
+
+
+@pytest.mark.parametrize("tile_size", [0, -3])
+def test_rejects_non_positive_tile_size(sample_map, tile_size):
+    trapezoids = [node.value for node in sample_map.trapezoidal_nodes]
+    with pytest.raises(ValueError):
+        rasterize_map(trapezoids, WIDTH, HEIGHT, tile_size=tile_size)
@@ -0,0 +1,69 @@
+"""
+file: test_storage.py
+description: This program tests that built maps survive saving, loading and
+querying through the trapmap command.
+language: python3
+author: Anurag Kallurwar, ak6491@rit.edu
+author: Neel Chaudhary, nc5834@rit.edu
+"""
+
+
+import os
+import random
+from trapezoidal_maps.cli import main
+from trapezoidal_maps.construction import build_map, read_input
+from trapezoidal_maps.storage import load_map, save_map
+from trapezoidal_maps.structure import Point
+
+
+SAMPLE_FILE = os.path.join(os.path.dirname(__file__), "..", "ak6491.txt")
+
+def write_sorted_input(file_name, count: int):
+    """
+    Write an input file of short, non crossing segments sorted by x
+    :param file_name: name of file
+    :param count: number of segments
+    :return: None
+    """
+    lines = [str(count), "0 0 " + str(2 * count + 2) + " 100"]
+    for index in range(count):
+        y = 20 + (index % 7) * 5
+        lines.append(str(2 * index + 1) + " " + str(y) + " "
+                     + str(2 * index + 1.5) + " " + str(y + 5))
+    with open(file_name, 'w') as file:
+        file.write("\n".join(lines) + "\n")
+
+
+def test_large_map_survives_build_and_query(tmp_path, capsys):
+    input_file = str(tmp_path / "input.txt")
+    map_file = str(tmp_path / "map.json")
+    write_sorted_input(input_file, 300)
+    assert main(["build", input_file, "-o", map_file]) == 0
+    number_of_segments, bounding_box, segments = read_input(input_file)
+    map = build_map(bounding_box, segments)
+    generator = random.Random(0)
+    points = [Point(generator.uniform(0, 602), generator.uniform(0, 100))
+              for _ in range(200)]
+    capsys.readouterr()
+    coordinates = [str(value) for point in points
+                   for value in (point.x, point.y)]
+    assert main(["query", map_file] + coordinates) == 0
+    printed = capsys.readouterr().out.split()
+    assert printed == [map.root.locate(point).value.id for point in points]
+
+
+def test_load_map_restores_the_graph(tmp_path):
+    map_file = str(tmp_path / "map.json")
+    number_of_segments, bounding_box, segments = read_input(SAMPLE_FILE)
+    map = build_map(bounding_box, segments)
+    save_map(map_file, map)
+    saved = load_map(map_file)
+    assert [repr(trapezoid) for trapezoid in saved["trapezoids"]] == \
+           [repr(node.value) for node in map.trapezoidal_nodes]
+    assert [repr(segment) for segment in saved["segments"]] == \
+           [repr(segment) for segment in segments]
+    for x in range(0, 100, 3):
+        for y in range(0, 100, 3):
+            point = Point(x + 0.5, y + 0.5)
+            assert saved["root"].locate(point).value.id == \
+                   map.root.locate(point).value.id
@@ -0,0 +1,12 @@
+"""
+file: __init__.py
+description: This package builds trapezoidal maps using the randomized
+incremental algorithm. The modules are structure (points, segments,
+trapezoids and the DAG nodes), construction (building the map), storage
+(saving built maps), rasterize (label arrays, needs numpy), harness
+(checking point location engines) and cli (the trapmap command). Nothing is
+imported here, so every subcommand loads only the modules it needs.
+language: python3
+author: Anurag Kallurwar, ak6491@rit.edu
+author: Neel Chaudhary, nc5834@rit.edu
+"""
@@ -0,0 +1,16 @@
+"""
+file: __main__.py
+description: This program runs the trapmap command for python -m
+trapezoidal_maps.
+language: python3
+author: Anurag Kallurwar, ak6491@rit.edu
+author: Neel Chaudhary, nc5834@rit.edu
+"""
+
+
+import sys
+from trapezoidal_maps.cli import main
+
+
+if __name__ == '__main__':
+    sys.exit(main())  # Calling Main Function
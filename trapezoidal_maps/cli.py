@@ -0,0 +1,305 @@
+"""
+file: cli.py
+description: This program is the command line entry point for building,
+querying, exporting, rasterizing, benchmarking and checking trapezoidal maps.
+Every subcommand imports only the modules it needs, so that querying a
+prebuilt map does not pay for the construction code.
+language: python3
+author: Anurag Kallurwar, ak6491@rit.edu
+author: Neel Chaudhary, nc5834@rit.edu
+"""
+
+
+import argparse
+import math
+import sys
+
+
+DEFAULT_MAP_FILE = "trapezoidal_map.json"
+DEFAULT_MATRIX_FILE = "output_dag_matrix.csv"
+DEFAULT_RASTER_FILE = "trapezoidal_map_labels.npy"
+
+
+def build(args):
+    """
+    Build the trapezoidal map for the input file and save it
+    :param args: parsed CLI arguments
+    :return: exit status
+    """
+    from trapezoidal_maps.construction import build_map, read_input
+    from trapezoidal_maps.storage import save_map
+    number_of_segments, bounding_box, segments = read_input(args.file_name)
+    map = build_map(bounding_box, segments)
+    save_map(args.output, map)
+    print("Trapezoids: " + str(len(map.trapezoidal_nodes)))
+    if args.verbose:
+        for node in map.trapezoidal_nodes:
+            print(repr(node.value))
+    print("WRITING TO OUPUT FILE: " + args.output)
+    return 0
+
+
+def query(args):
+    """
+    Locate the trapezoid containing every query point in a prebuilt map
+    :param args: parsed CLI arguments
+    :return: exit status
+    """
+    from trapezoidal_maps.storage import load_map
+    from trapezoidal_maps.structure import Point
+    if len(args.coordinates) % 2 != 0:
+        print("Please provide the query points as x y pairs")
+        return 1
+    root = load_map(args.map_file)["root"]
+    for index in range(0, len(args.coordinates), 2):
+        point = Point(args.coordinates[index], args.coordinates[index + 1])
+        trapezoid = root.locate(point).value
+        if args.verbose:
+            print(repr(point) + " -> " + repr(trapezoid))
+        else:
+            print(trapezoid.id)
+    return 0
+
+
+def export(args):
+    """
+    Write the adjacency matrix of a prebuilt map to a CSV file
+    :param args: parsed CLI arguments
+    :return: exit status
+    """
+    from trapezoidal_maps.construction import TrapezoidalMap, write_output
+    from trapezoidal_maps.storage import load_map
+    saved = load_map(args.map_file)
+    map = TrapezoidalMap(saved["root"], saved["segments"])
+    map.get_all_Trapezoids()
+    map.create_adjacency_matrix()
+    if args.verbose:
+        for row in map.matrix:
+            print(row)
+    write_output(args.output, map.matrix)
+    return 0
+
+
+def raster(args):
+    """
+    Write the label array of a prebuilt map for a raster grid to a .npy file
+    :param args: parsed CLI arguments
+    :return: exit status
+    """
+    if args.width < 1 or args.height < 1:
+        print("Please provide a positive width and height")
+        return 1
+    if args.tile_size is not None and args.tile_size < 1:
+        print("Please provide a positive tile size")
+        return 1
+    # numpy adds .npy when saving, so add it here for the memmap too
+    output = args.output
+    if not output.endswith(".npy"):
+        output += ".npy"
+    try:
+        import numpy as np
+        from trapezoidal_maps.rasterize import rasterize_map
+    except ImportError:
+        print("Please install numpy to rasterize maps")
+        return 1
+    from trapezoidal_maps.storage import load_map
+    trapezoids = load_map(args.map_file)["trapezoids"]
+    out = None
+    # Writing tiles straight to file keeps only one tile in memory
+    if args.tile_size:
+        out = np.lib.format.open_memmap(output, mode='w+',
+                                        dtype=np.int32,
+                                        shape=(args.height, args.width))
+    labels = rasterize_map(trapezoids, args.width, args.height,
+                           tile_size=args.tile_size, out=out)
+    if args.tile_size:
+        labels.flush()
+    else:
+        np.save(output, labels)
+    unbounded = [trapezoid.id for trapezoid in trapezoids
+                 if trapezoid.left is None or trapezoid.right is None]
+    if unbounded:
+        print("Skipped unbounded trapezoids: " + ", ".join(unbounded))
+    if args.verbose:
+        for index, trapezoid in enumerate(trapezoids):
+            print(str(index) + " -> " + repr(trapezoid))
+    print("WRITING TO OUPUT FILE: " + output)
+    return 0
+
+
+def bench(args):
+    """
+    Time reading, building and querying the trapezoidal map for an input file
+    :param args: parsed CLI arguments
+    :return: exit status
+    """
+    import random
+    import time
+    from trapezoidal_maps.structure import Point
+    from trapezoidal_maps.construction import build_map, read_input
+    start = time.perf_counter()
+    number_of_segments, bounding_box, segments = read_input(args.file_name)
+    read_time = time.perf_counter() - start
+    start = time.perf_counter()
+    map = build_map(bounding_box, segments)
+    build_time = time.perf_counter() - start
+    # Random query points inside the bounding box
+    generator = random.Random(args.seed)
+    min_x, max_x = bounding_box.left.x, bounding_box.right.x
+    min_y, max_y = bounding_box.bottom.start.y, bounding_box.top.start.y
+    points = [Point(generator.uniform(min_x, max_x),
+                    generator.uniform(min_y, max_y))
+              for _ in range(args.queries)]
+    start = time.perf_counter()
+    for point in points:
+        map.root.locate(point)
+    query_time = time.perf_counter() - start
+    print("Segments: " + str(len(segments)))
+    print("Trapezoids: " + str(len(map.trapezoidal_nodes)))
+    print("Read: {:.3f} ms".format(read_time * 1000))
+    print("Build: {:.3f} ms".format(build_time * 1000))
+    print("Queries: " + str(args.queries) + " in {:.3f} ms".format(
+        query_time * 1000))
+    if args.queries:
+        print("Query: {:.3f} us each".format(
+            query_time * 1e6 / args.queries))
+    return 0
+
+
+def check(args):
+    """
+    Compare every point location engine with the reference engine on seeded
+    random maps and report mismatches, construction defects and throughput
+    :param args: parsed CLI arguments
+    :return: exit status, 1 only if an engine disagrees with the reference
+    """
+    from trapezoidal_maps.harness import REFERENCE_ENGINE, run_harness
+    mismatches, defects, stats = run_harness(args.cases, args.segments,
+                                             args.queries, args.seed)
+    print("Cases: " + str(args.cases) + ", seeds " + str(args.seed) + " to "
+          + str(args.seed + args.cases - 1))
+    print("Queries: " + str(stats["queries"]))
+    for name, seconds in stats["seconds"].items():
+        throughput = stats["queries"] / seconds if seconds else math.inf
+        print(name + ": {:.0f} queries/s".format(throughput))
+    print("\n============================================================")
+    print("Mismatches with " + REFERENCE_ENGINE + ": " + str(len(mismatches)))
+    print_findings(mismatches, stats["failed_seeds"], args.verbose)
+    print("\n============================================================")
+    print("Construction defects: " + str(len(defects)))
+    print_findings(defects, stats["defect_seeds"], args.verbose)
+    return 1 if mismatches else 0
+
+
+def print_findings(findings: list, seeds: list, verbose: bool):
+    """
+    Print the seeds and the first findings of the harness
+    :param findings: list of descriptions
+    :param seeds: seeds with findings
+    :param verbose: print all findings
+    :return: None
+    """
+    if seeds:
+        print("Seeds: " + ", ".join(str(seed) for seed in seeds))
+    shown = findings if verbose else findings[:10]
+    for finding in shown:
+        print(finding)
+    if len(shown) < len(findings):
+        print("... use --verbose to print all")
+
+
+def create_parser():
+    """
+    Create the CLI argument parser with all subcommands
+    :return: ArgumentParser
+    """
+    parser = argparse.ArgumentParser(prog="trapmap",
+                                     description="Trapezoidal maps using "
+                                                 "randomized incremental "
+                                                 "construction")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = subparsers.add_parser("build", help="build a map from an "
+                                                       "input file")
+    build_parser.add_argument("file_name", help="input file with bounding "
+                                                "box and segments")
+    build_parser.add_argument("-o", "--output", default=DEFAULT_MAP_FILE,
+                              help="map file to write")
+    build_parser.add_argument("--verbose", action="store_true",
+                              help="print all trapezoids")
+    build_parser.set_defaults(handler=build)
+
+    query_parser = subparsers.add_parser("query", help="locate points in a "
+                                                       "prebuilt map")
+    query_parser.add_argument("map_file", help="map file written by build")
+    query_parser.add_argument("coordinates", type=float, nargs="+",
+                              help="query points as x y pairs")
+    query_parser.add_argument("--verbose", action="store_true",
+                              help="print the full trapezoid of each point")
+    query_parser.set_defaults(handler=query)
+
+    export_parser = subparsers.add_parser("export", help="write the adjacency "
+                                                         "matrix of a map")
+    export_parser.add_argument("map_file", help="map file written by build")
+    export_parser.add_argument("-o", "--output", default=DEFAULT_MATRIX_FILE,
+                               help="CSV file to write")
+    export_parser.add_argument("--verbose", action="store_true",
+                               help="print every row of the matrix")
+    export_parser.set_defaults(handler=export)
+
+    raster_parser = subparsers.add_parser("raster", help="label a raster "
+                                                         "grid with the "
+                                                         "trapezoids of a map")
+    raster_parser.add_argument("map_file", help="map file written by build")
+    raster_parser.add_argument("width", type=int, help="number of columns")
+    raster_parser.add_argument("height", type=int, help="number of rows")
+    raster_parser.add_argument("-o", "--output", default=DEFAULT_RASTER_FILE,
+                               help=".npy file to write")
+    raster_parser.add_argument("--tile-size", type=int, default=None,
+                               help="rasterize in tiles of this many rows "
+                                    "and columns to bound memory")
+    raster_parser.add_argument("--verbose", action="store_true",
+                               help="print the trapezoid of every label")
+    raster_parser.set_defaults(handler=raster)
+
+    bench_parser = subparsers.add_parser("bench", help="time building and "
+                                                       "querying a map")
+    bench_parser.add_argument("file_name", help="input file with bounding "
+                                                "box and segments")
+    bench_parser.add_argument("-n", "--queries", type=int, default=100000,
+                              help="number of random query points")
+    bench_parser.add_argument("--seed", type=int, default=0,
+                              help="seed for the random query points")
+    bench_parser.set_defaults(handler=bench)
+
+    check_parser = subparsers.add_parser("check", help="compare point "
+                                                       "location engines "
+                                                       "on random maps")
+    check_parser.add_argument("-c", "--cases", type=int, default=100,
+                              help="number of random maps")
+    check_parser.add_argument("-s", "--segments", type=int, default=10,
+                              help="maximum number of segments per map")
+    check_parser.add_argument("-n", "--queries", type=int, default=1000,
+                              help="number of random query points per map")
+    check_parser.add_argument("--seed", type=int, default=0,
+                              help="seed of the first map, map i uses "
+                                   "seed + i")
+    check_parser.add_argument("--verbose", action="store_true",
+                              help="print all mismatches and "
+                                   "defects")
+    check_parser.set_defaults(handler=check)
+    return parser
+
+
+def main(argv = None):
+    """
+    The main function
+    :param argv: CLI arguments, defaults to sys.argv
+    :return: exit status
+    """
+    args = create_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())  # Calling Main Function
@@ -1,5 +1,5 @@
 """
-file: trapezoidal_maps.py
+file: construction.py
 description: This program implements the random increemental algorithm to
 create trapezoidal map for given space containing lines.
 language: python3
@@ -8,10 +8,9 @@ author: Neel Chaudhary, nc5834@rit.edu
 """
 
 
-import math
-import sys
+import argparse
 import csv
-from structure import *
+from trapezoidal_maps.structure import Point, Segment, Trapezoid, TreeNode, Type
 
 
 class TrapezoidalMap:
@@ -139,7 +138,6 @@ class TrapezoidalMap:
         :return: None
         """
         sums = [0] * (len(self.matrix[1]) - 1)
-        print(self.matrix[0])
         self.matrix[0].append('SUM')
         for index1 in range(1, len(self.matrix)):
             row_sum = sum(self.matrix[index1][1:])
@@ -150,6 +148,23 @@ class TrapezoidalMap:
 
 
 
+def create_bounding_box(min_x: float, min_y: float, max_x: float,
+                        max_y: float):
+    """
+    Create the bounding box trapezoid
+    :param min_x: left x-coordinate
+    :param min_y: bottom y-coordinate
+    :param max_x: right x-coordinate
+    :param max_y: top y-coordinate
+    :return: Trapezoid object
+    """
+    return Trapezoid(Segment(Point(min_x, max_y, 'Pb1'),
+                             Point(max_x, max_y, 'Qb1'), 'Sb1'),
+                     Segment(Point(min_x, min_y, 'Pb2'),
+                             Point(max_x, min_y, 'Qb2'), 'Sb2'),
+                     Point(min_x, max_y, 'Pb1'), Point(max_x, max_y, 'Qb1'))
+
+
 def read_input(file_name: str):
     """
     Read input from file
@@ -163,18 +178,7 @@ def read_input(file_name: str):
     number_of_segments = int(str_lines[0])
     # Bounding box trapezoid
     bounding_box = [float(a) for a in str_lines[1].split(' ')]
-    initial_trapezoid = Trapezoid(Segment(Point(bounding_box[0],
-                                                bounding_box[3], 'Pb1'),
-                                          Point(bounding_box[2],
-                                                bounding_box[3], 'Qb1'), 'Sb1'),
-                                  Segment(Point(bounding_box[0],
-                                                bounding_box[1], 'Pb2'),
-                                          Point(bounding_box[2],
-                                                bounding_box[1], 'Qb2'),
-                                          'Sb2'), Point(bounding_box[0],
-                                                bounding_box[3], 'Pb1'),
-                                  Point(bounding_box[2], bounding_box[3],
-                                        'Qb1'))
+    initial_trapezoid = create_bounding_box(*bounding_box)
     # Segments with unique points
     count = 1
     unique_points = []
@@ -368,16 +372,16 @@ def handle_partial_segment(map: TrapezoidalMap, segment: Segment,
             # Creating Subtree
             s_node = TreeNode(segment, upper_trapezoid, lower_trapezoid)
             if not current_node.update_node(s_node):
-                print("NO PARENT")
                 map.root = current_node
 
 
-def generate_map(initial_trapezoid, segments: list):
+def build_map(initial_trapezoid, segments: list):
     """
-    Implement random increemental algorithm to generate a trapezoidal map
+    Implement random increemental algorithm to build the directed acyclic
+    graph of the trapezoidal map, without the adjacency matrix
     :param initial_trapezoid: Boundin box trapezoid
     :param segments: Input segments
-    :return: None
+    :return: Trapezoidal map
     """
     # Initializing trapezoidal map
     map = TrapezoidalMap(TreeNode(initial_trapezoid), segments)
@@ -398,6 +402,17 @@ def generate_map(initial_trapezoid, segments: list):
     map.get_all_Trapezoids()
     # Set names for trapezoids
     map.set_trapezoid_names()
+    return map
+
+
+def generate_map(initial_trapezoid, segments: list):
+    """
+    Implement random increemental algorithm to generate a trapezoidal map
+    :param initial_trapezoid: Boundin box trapezoid
+    :param segments: Input segments
+    :return: adjacency matrix and list of trapezoids
+    """
+    map = build_map(initial_trapezoid, segments)
     # Create adjacency matrix
     map.create_adjacency_matrix()
     trapezoids = []
@@ -412,13 +427,15 @@ def main():
     :return: None
     """
     # Check for CLI paramters
-    if len(sys.argv) < 2:
-        print("Please provide an input file")
-        print("USAGE: trapezoidal_maps.py <filename.txt>")
-        return
-    file_name = str(sys.argv[1])
+    parser = argparse.ArgumentParser(prog="python -m "
+                                          "trapezoidal_maps.construction")
+    parser.add_argument("file_name", help="input file with bounding box "
+                                          "and segments")
+    parser.add_argument("--verbose", action="store_true",
+                        help="print all trapezoids and the adjacency matrix")
+    args = parser.parse_args()
+    file_name = args.file_name
     output_file_name = "output_dag_matrix.csv"
-    # file_name = input("Input file name: ")
 
     # Reading input
     print("\n============================================================")
@@ -428,13 +445,14 @@ def main():
     # Trapezoidal Map
     print("\n============================================================")
     dag_matrix, trapezoids = generate_map(bounding_box, segments)
-    print("Trapezoids")
-    for trapezoid in trapezoids:
-        print(repr(trapezoid))
-    print("\n============================================================")
-    print("Adjacency Matrix")
-    for row in dag_matrix:
-        print(row)
+    print("Trapezoids: " + str(len(trapezoids)))
+    if args.verbose:
+        for trapezoid in trapezoids:
+            print(repr(trapezoid))
+        print("\n============================================================")
+        print("Adjacency Matrix")
+        for row in dag_matrix:
+            print(row)
 
     # Writing output to file
     print("\n============================================================")
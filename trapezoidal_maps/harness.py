@@ -0,0 +1,292 @@
+"""
+file: harness.py
+description: This program checks every point location engine against the
+directed acyclic graph walk of the current construction on seeded random maps
+and queries, and reports the mismatches together with the throughput of every
+engine. A brute force scan over all leaf trapezoids checks the construction
+itself; its findings are reported apart as construction defects.
+language: python3
+author: Anurag Kallurwar, ak6491@rit.edu
+author: Neel Chaudhary, nc5834@rit.edu
+"""
+
+
+import os
+import random
+import tempfile
+import time
+from trapezoidal_maps.structure import Point, Segment, Trapezoid
+from trapezoidal_maps.construction import build_map, create_bounding_box
+from trapezoidal_maps.storage import load_map, save_map
+
+
+BOUNDS = (0.0, 0.0, 100.0, 100.0)
+
+
+def dag_engine(map):
+    """
+    Point location by walking the directed acyclic graph
+    :param map: Trapezoidal map
+    :return: function from Point to Trapezoid
+    """
+    root = map.root
+    return lambda point: root.locate(point).value
+
+
+def stored_engine(map):
+    """
+    Point location on the map read back by load_map after save_map
+    :param map: Trapezoidal map
+    :return: function from Point to Trapezoid
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        file_name = os.path.join(directory, "map.json")
+        save_map(file_name, map)
+        root = load_map(file_name)["root"]
+    return lambda point: root.locate(point).value
+
+
+# Engines to check, by name. An engine takes a built map and returns a
+# function locating the Trapezoid of a Point. Every engine must give the same
+# trapezoid as the REFERENCE_ENGINE, the current object graph walk.
+REFERENCE_ENGINE = "dag"
+LOCATE_ENGINES = {
+    REFERENCE_ENGINE: dag_engine,
+    "stored": stored_engine,
+}
+
+
+def brute_force_locate(trapezoids: list, point: Point):
+    """
+    Find all trapezoids containing the point by scanning every leaf
+    :param trapezoids: list of leaf Trapezoid objects
+    :param point: Point object
+    :return: list of Trapezoid objects
+    """
+    return [trapezoid for trapezoid in trapezoids
+            if trapezoid.contains_point(point)]
+
+
+def orientation(a: Point, b: Point, c: Point):
+    """
+    Orientation of the triangle a, b, c
+    :return: 1 if counter clockwise, -1 if clockwise, 0 if collinear
+    """
+    value = (b.x - a.x) * (c.y - a.y) - (b.y - a.y) * (c.x - a.x)
+    if value > 0:
+        return 1
+    if value < 0:
+        return -1
+    return 0
+
+
+def segments_touch(first: Segment, second: Segment):
+    """
+    Check if two segments intersect or touch
+    :param first: Segment object
+    :param second: Segment object
+    :return: True or False
+    """
+    if first.end.x < second.start.x or second.end.x < first.start.x:
+        return False
+    o1 = orientation(first.start, first.end, second.start)
+    o2 = orientation(first.start, first.end, second.end)
+    o3 = orientation(second.start, second.end, first.start)
+    o4 = orientation(second.start, second.end, first.end)
+    if o1 * o2 <= 0 and o3 * o4 <= 0:
+        return True
+    return False
+
+
+def random_segments(generator: random.Random, count: int,
+                    bounds: tuple = BOUNDS):
+    """
+    Generate non crossing segments with distinct endpoint x-coordinates
+    strictly inside the bounds, as the construction expects
+    :param generator: seeded random.Random
+    :param count: wanted number of segments
+    :param bounds: min x, min y, max x, max y
+    :return: list of Segment objects, may be shorter than count
+    """
+    min_x, min_y, max_x, max_y = bounds
+    segments = []
+    used_x = set()
+    attempts = 0
+    while len(segments) < count and attempts < 100 * count:
+        attempts += 1
+        x1 = generator.uniform(min_x, max_x)
+        x2 = generator.uniform(min_x, max_x)
+        if x1 == x2 or x1 in used_x or x2 in used_x or \
+                min_x in (x1, x2) or max_x in (x1, x2):
+            continue
+        if x1 > x2:
+            x1, x2 = x2, x1
+        number = str(len(segments) + 1)
+        segment = Segment(Point(x1, generator.uniform(min_y, max_y),
+                                'P' + number),
+                          Point(x2, generator.uniform(min_y, max_y),
+                                'Q' + number), 'S' + number)
+        if segment.start.y in (min_y, max_y) or segment.end.y in (min_y,
+                                                                  max_y):
+            continue
+        if any(segments_touch(segment, other) for other in segments):
+            continue
+        used_x.update((x1, x2))
+        segments.append(segment)
+    return segments
+
+
+def random_queries(generator: random.Random, count: int, segments: list,
+                   bounds: tuple = BOUNDS):
+    """
+    Generate query points inside the bounds. One in four points lies on the
+    vertical line through a segment endpoint to exercise the boundaries.
+    :param generator: seeded random.Random
+    :param count: number of points
+    :param segments: list of Segment objects
+    :param bounds: min x, min y, max x, max y
+    :return: list of Point objects
+    """
+    min_x, min_y, max_x, max_y = bounds
+    endpoints = [point.x for segment in segments
+                 for point in (segment.start, segment.end)]
+    points = []
+    for index in range(count):
+        if endpoints and generator.random() < 0.25:
+            x = generator.choice(endpoints)
+        else:
+            x = generator.uniform(min_x, max_x)
+        points.append(Point(x, generator.uniform(min_y, max_y), 'R' +
+                            str(index + 1)))
+    return points
+
+
+def add_time(stats: dict, name: str, seconds: float):
+    """
+    Add the seconds spent by an engine to the stats
+    :param stats: dictionary with the seconds spent by every engine
+    :param name: name of engine
+    :param seconds: time spent
+    :return: None
+    """
+    stats["seconds"][name] = stats["seconds"].get(name, 0) + seconds
+
+
+def run_engine(name: str, engine, map, points: list, stats: dict):
+    """
+    Locate all points with an engine and time it
+    :param name: name of engine
+    :param engine: function from a map to a locate function
+    :param map: Trapezoidal map
+    :param points: list of Point objects
+    :param stats: dictionary with the seconds spent by every engine
+    :return: list of trapezoid names, or the error raised for a point
+    """
+    locate = engine(map)
+    answers = []
+    start = time.perf_counter()
+    for point in points:
+        try:
+            answers.append(locate(point))
+        except Exception as error:
+            answers.append(error)
+    add_time(stats, name, time.perf_counter() - start)
+    return [answer.id if isinstance(answer, Trapezoid) else repr(answer)
+            for answer in answers]
+
+
+def check_case(seed: int, max_segments: int, queries: int, engines: dict,
+               stats: dict):
+    """
+    Build one random map, compare every engine with the reference engine on
+    every point and check the construction with the brute force scan
+    :param seed: seed of the case
+    :param max_segments: maximum number of segments
+    :param queries: number of query points
+    :param engines: dictionary of engines by name
+    :param stats: dictionary with the number of queries and the seconds
+    spent by every engine, updated in place
+    :return: list of engine mismatches and list of construction defects
+    """
+    generator = random.Random(seed)
+    segments = random_segments(generator, generator.randint(1, max_segments))
+    points = random_queries(generator, queries, segments)
+    prefix = "seed " + str(seed) + ": "
+    try:
+        map = build_map(create_bounding_box(*BOUNDS), segments)
+    except Exception as error:
+        return [], [prefix + "build failed with " + repr(error) + " for "
+                    + repr(segments)]
+    trapezoids = [node.value for node in map.trapezoidal_nodes]
+    defects = []
+    # The brute force scan can only test bounded trapezoids
+    bounded = []
+    for trapezoid in trapezoids:
+        if trapezoid.left is None or trapezoid.right is None:
+            defects.append(prefix + "build left unbounded " + repr(trapezoid))
+        else:
+            bounded.append(trapezoid)
+    # Reference answers
+    reference = run_engine(REFERENCE_ENGINE, engines.get(REFERENCE_ENGINE,
+                                                         dag_engine),
+                           map, points, stats)
+    # Engine answers
+    mismatches = []
+    for name, engine in engines.items():
+        if name == REFERENCE_ENGINE:
+            continue
+        answers = run_engine(name, engine, map, points, stats)
+        for point, answer, expected in zip(points, answers, reference):
+            if answer != expected:
+                mismatches.append(prefix + name + " returned " + answer
+                                  + " for " + repr(point) + ", "
+                                  + REFERENCE_ENGINE + " " + expected)
+    # Oracle answers
+    start = time.perf_counter()
+    found = [brute_force_locate(bounded, point) for point in points]
+    add_time(stats, "brute-force", time.perf_counter() - start)
+    for point, containing, expected in zip(points, found, reference):
+        if len(containing) != 1:
+            defects.append(prefix + "brute-force found "
+                           + str(len(containing)) + " trapezoids for "
+                           + repr(point))
+        elif containing[0].id != expected:
+            defects.append(prefix + REFERENCE_ENGINE + " returned " + expected
+                           + " for " + repr(point) + ", brute-force "
+                           + containing[0].id)
+    stats["queries"] += len(points)
+    return mismatches, defects
+
+
+def run_harness(cases: int = 100, max_segments: int = 10,
+                queries: int = 1000, seed: int = 0, engines: dict = None):
+    """
+    Check all engines over many random cases. Case i uses seed + i, so a
+    failing case is reproduced with that seed and cases = 1. Only engine
+    mismatches mean an engine is wrong; construction defects come from the
+    map that every engine is given.
+    :param cases: number of random maps
+    :param max_segments: maximum number of segments per map
+    :param queries: number of query points per map
+    :param seed: seed of the first case
+    :param engines: dictionary of engines by name, defaults to LOCATE_ENGINES
+    :return: list of engine mismatches, list of construction defects and
+    dictionary with the number of queries, the seconds spent by every engine
+    and the seeds with mismatches and with defects
+    """
+    if engines is None:
+        engines = LOCATE_ENGINES
+    mismatches = []
+    defects = []
+    stats = {"queries": 0, "seconds": dict(), "failed_seeds": [],
+             "defect_seeds": []}
+    for case in range(cases):
+        case_mismatches, case_defects = check_case(seed + case, max_segments,
+                                                   queries, engines, stats)
+        if case_mismatches:
+            stats["failed_seeds"].append(seed + case)
+        if case_defects:
+            stats["defect_seeds"].append(seed + case)
+        mismatches += case_mismatches
+        defects += case_defects
+    return mismatches, defects, stats
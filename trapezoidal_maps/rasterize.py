@@ -0,0 +1,139 @@
+"""
+file: rasterize.py
+description: This program fills a label array for a raster grid over a built
+trapezoidal map by scan converting every leaf trapezoid, instead of running
+one query through the directed acyclic graph for every pixel. Requires numpy.
+language: python3
+author: Anurag Kallurwar, ak6491@rit.edu
+author: Neel Chaudhary, nc5834@rit.edu
+"""
+
+
+import numpy as np
+
+
+NO_TRAPEZOID = -1
+
+
+def map_bounds(trapezoids: list):
+    """
+    Compute the bounding box covered by the top and bottom segments of the
+    trapezoids, which include the Sb1 and Sb2 sides of the bounding box. This
+    does not need the left and right points, so unbounded leaves are fine.
+    :param trapezoids: list of leaf Trapezoid objects
+    :return: min x, min y, max x, max y
+    """
+    segments = [segment for trapezoid in trapezoids
+                for segment in (trapezoid.top, trapezoid.bottom)]
+    min_x = min(segment.start.x for segment in segments)
+    max_x = max(segment.end.x for segment in segments)
+    min_y = min(min(segment.start.y, segment.end.y) for segment in segments)
+    max_y = max(max(segment.start.y, segment.end.y) for segment in segments)
+    return min_x, min_y, max_x, max_y
+
+
+def pixel_centers(low: float, high: float, count: int):
+    """
+    Compute the coordinates of the pixel centers along one axis
+    :param low: lower bound of the axis
+    :param high: upper bound of the axis
+    :param count: number of pixels
+    :return: numpy array of coordinates
+    """
+    return low + (np.arange(count) + 0.5) * ((high - low) / count)
+
+
+def fill_trapezoids(labels, trapezoids: list, xs, ys):
+    """
+    Scan convert the trapezoids into the label array. A pixel gets the index
+    of the trapezoid whose contains_point is True for the pixel center.
+    Trapezoids without a left or right point are skipped, so their pixels
+    keep their label.
+    :param labels: numpy array of shape (len(ys), len(xs)) to fill
+    :param trapezoids: list of leaf Trapezoid objects
+    :param xs: sorted x coordinates of the pixel centers
+    :param ys: sorted y coordinates of the pixel centers
+    :return: None
+    """
+    for index, trapezoid in enumerate(trapezoids):
+        if trapezoid.left is None or trapezoid.right is None:
+            continue
+        # Columns with left.x <= x < right.x
+        start = np.searchsorted(xs, trapezoid.left.x, 'left')
+        end = np.searchsorted(xs, trapezoid.right.x, 'left')
+        if start >= end:
+            continue
+        x = xs[start:end]
+        # Rows with bottom y < y <= top y in every column
+        lower = np.searchsorted(ys, trapezoid.bottom.calculate_y(x), 'right')
+        upper = np.searchsorted(ys, trapezoid.top.calculate_y(x), 'right')
+        row_start = lower.min()
+        row_end = upper.max()
+        if row_start >= row_end:
+            continue
+        rows = np.arange(row_start, row_end)[:, None]
+        mask = (rows >= lower) & (rows < upper)
+        labels[row_start:row_end, start:end][mask] = index
+
+
+def iter_tiles(trapezoids: list, bounds: tuple, width: int, height: int,
+               tile_size: int):
+    """
+    Rasterize the trapezoids one tile at a time
+    :param trapezoids: list of leaf Trapezoid objects
+    :param bounds: min x, min y, max x, max y of the raster
+    :param width: number of columns
+    :param height: number of rows
+    :param tile_size: maximum number of rows and columns of a tile, at least 1
+    :return: generator of (first row, first column, label array)
+    """
+    min_x, min_y, max_x, max_y = bounds
+    xs = pixel_centers(min_x, max_x, width)
+    ys = pixel_centers(min_y, max_y, height)
+    for row in range(0, height, tile_size):
+        for column in range(0, width, tile_size):
+            tile_xs = xs[column:column + tile_size]
+            tile_ys = ys[row:row + tile_size]
+            labels = np.full((len(tile_ys), len(tile_xs)), NO_TRAPEZOID,
+                             dtype=np.int32)
+            fill_trapezoids(labels, trapezoids, tile_xs, tile_ys)
+            yield row, column, labels
+
+
+def rasterize_map(trapezoids: list, width: int, height: int,
+                  bounds: tuple = None, tile_size: int = None, out = None):
+    """
+    Label every pixel of a raster with the index of the trapezoid containing
+    its center. Row 0 is the bottom of the map and column 0 its left side;
+    pixels outside every trapezoid get NO_TRAPEZOID.
+    :param trapezoids: list of leaf Trapezoid objects
+    :param width: number of columns
+    :param height: number of rows
+    :param bounds: min x, min y, max x, max y, defaults to map_bounds
+    :param tile_size: rasterize in tiles of this size to bound memory, at
+    least 1
+    :param out: int32 array of shape (height, width) to write into, for
+    example a numpy memmap
+    :return: label array
+    """
+    if width < 1 or height < 1:
+        raise ValueError("width and height must be positive")
+    if tile_size is None:
+        tile_size = max(width, height)
+    elif tile_size < 1:
+        raise ValueError("tile_size must be positive")
+    if bounds is None:
+        bounds = map_bounds(trapezoids)
+    if out is None:
+        out = np.empty((height, width), dtype=np.int32)
+    min_x, min_y, max_x, max_y = bounds
+    xs = pixel_centers(min_x, max_x, width)
+    ys = pixel_centers(min_y, max_y, height)
+    # Filling every tile through a view of out, without a second array
+    for row in range(0, height, tile_size):
+        for column in range(0, width, tile_size):
+            labels = out[row:row + tile_size, column:column + tile_size]
+            labels[...] = NO_TRAPEZOID
+            fill_trapezoids(labels, trapezoids, xs[column:column + tile_size],
+                            ys[row:row + tile_size])
+    return out
@@ -0,0 +1,117 @@
+"""
+file: storage.py
+description: This program writes and reads built trapezoidal maps. The
+directed acyclic graph is stored as flat JSON tables of points, segments,
+trapezoids and nodes that refer to each other by index.
+language: python3
+author: Anurag Kallurwar, ak6491@rit.edu
+author: Neel Chaudhary, nc5834@rit.edu
+"""
+
+
+import json
+from trapezoidal_maps.structure import Point, Segment, Trapezoid, TreeNode
+
+
+def encode_value(value, tables: dict, indices: dict):
+    """
+    Add a Point, Segment or Trapezoid and the values it refers to the tables
+    :param value: Point / Segment / Trapezoid object or None
+    :param tables: dictionary of rows by Type name
+    :param indices: dictionary of row indices by object id
+    :return: row index of value, None for None
+    """
+    if value is None:
+        return None
+    if id(value) in indices:
+        return indices[id(value)]
+    if isinstance(value, Point):
+        table = tables["POINT"]
+        row = [value.x, value.y, value.id]
+    elif isinstance(value, Segment):
+        table = tables["SEGMENT"]
+        row = [encode_value(value.start, tables, indices),
+               encode_value(value.end, tables, indices), value.id]
+    else:
+        table = tables["TRAPEZOID"]
+        row = [encode_value(value.top, tables, indices),
+               encode_value(value.bottom, tables, indices),
+               encode_value(value.left, tables, indices),
+               encode_value(value.right, tables, indices), value.id]
+    indices[id(value)] = len(table)
+    table.append(row)
+    return indices[id(value)]
+
+
+def save_map(file_name: str, map):
+    """
+    Write the directed acyclic graph of a built map to file as flat tables.
+    Nodes are numbered breadth first from the root and refer to their value
+    and children by index, so neither writing nor reading recurses.
+    :param file_name: name of file
+    :param map: Trapezoidal map
+    :return: None
+    """
+    # Numbering the nodes
+    order = [map.root]
+    node_indices = {id(map.root): 0}
+    index = 0
+    while index < len(order):
+        node = order[index]
+        for child in (node.leftChild, node.rightChild):
+            if child is not None and id(child) not in node_indices:
+                node_indices[id(child)] = len(order)
+                order.append(child)
+        index += 1
+    # Flattening the values
+    tables = {"POINT": [], "SEGMENT": [], "TRAPEZOID": []}
+    indices = dict()
+    nodes = []
+    for node in order:
+        left = None if node.leftChild is None else \
+            node_indices[id(node.leftChild)]
+        right = None if node.rightChild is None else \
+            node_indices[id(node.rightChild)]
+        nodes.append([node.get_type().name,
+                      encode_value(node.value, tables, indices), left,
+                      right])
+    segments = [encode_value(segment, tables, indices)
+                for segment in map.segments]
+    trapezoids = [encode_value(node.value, tables, indices)
+                  for node in map.trapezoidal_nodes]
+    with open(file_name, 'w') as file:
+        json.dump({"points": tables["POINT"], "segments": tables["SEGMENT"],
+                   "trapezoids": tables["TRAPEZOID"], "nodes": nodes,
+                   "input_segments": segments, "leaves": trapezoids}, file)
+
+
+def load_map(file_name: str):
+    """
+    Read the directed acyclic graph of a built map from file
+    :param file_name: name of file
+    :return: dictionary with root, segments and trapezoids
+    """
+    with open(file_name, 'r') as file:
+        data = json.load(file)
+    points = [Point(x, y, id) for x, y, id in data["points"]]
+    segments = [Segment(points[start], points[end], id)
+                for start, end, id in data["segments"]]
+    trapezoids = []
+    for top, bottom, left, right, id in data["trapezoids"]:
+        trapezoid = Trapezoid(segments[top], segments[bottom],
+                              None if left is None else points[left],
+                              None if right is None else points[right])
+        trapezoid.id = id
+        trapezoids.append(trapezoid)
+    tables = {"POINT": points, "SEGMENT": segments, "TRAPEZOID": trapezoids}
+    nodes = [TreeNode(tables[type][value])
+             for type, value, left, right in data["nodes"]]
+    # Linking the children
+    for node, (type, value, left, right) in zip(nodes, data["nodes"]):
+        if left is not None:
+            node.set_left_child(nodes[left])
+        if right is not None:
+            node.set_right_child(nodes[right])
+    return {"root": nodes[0],
+            "segments": [segments[index] for index in data["input_segments"]],
+            "trapezoids": [trapezoids[index] for index in data["leaves"]]}
@@ -260,6 +260,27 @@ class TreeNode():
                 parent.set_right_child(node)
         return True
 
+    def locate(self, point: Point):
+        """
+        Walk down from current TreeNode to the leaf containing the point
+        :param point: Point object
+        :return: leaf TreeNode
+        """
+        node = self
+        while not node.is_leaf():
+            # If node is X-node
+            if node.get_type() == Type.POINT:
+                if point.x >= node.value.x:
+                    node = node.rightChild
+                else:
+                    node = node.leftChild
+            # If node is Y-node
+            elif node.value.is_above(point):
+                node = node.leftChild
+            else:
+                node = node.rightChild
+        return node
+
     def __str__(self):
         return "NODE: " + str(self.value)
 